@@ -1,17 +1,44 @@
 from __future__ import annotations
 
+import binascii
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
+from operator import itemgetter
 import re
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import quote
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
-from utils.constants import GITHUB_API_BASE
+from utils import http_cache
+from utils.constants import GITHUB_API_BASE, GITHUB_GRAPHQL_URL
 from utils.helpers import combine_messages, get_github_token, iso_to_datetime, parse_repo_from_url
 
-
-@dataclass
+# Commit pages requested in parallel; kept low for GitHub's secondary rate limits
+COMMIT_PAGE_WINDOW = 8
+# Below this many remaining core requests, calls are spread out until the reset;
+# capped at a tenth of the reported limit so tokenless runs (60/hour) aren't paced
+# from the first call
+RATE_LIMIT_RESERVE = 100
+# Teams analyzed at once by analyze_many
+TEAM_CONCURRENCY = 10
+# repo: qualifiers per search query; longer queries get rejected
+SEARCH_REPO_BATCH = 5
+# Blobs resolved per GraphQL query when counting lines
+GRAPHQL_BLOB_BATCH = 50
+
+_LAST_PAGE_RE = re.compile(r"[?&]page=(\d+)")
+# Shared read-only fallback for missing nested objects in API payloads
+_EMPTY: Dict = {}
+
+
+@dataclass(slots=True)
 class CommitEntry:
     sha: str
     message: str
@@ -21,7 +48,7 @@ class CommitEntry:
     total_files: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoSnapshot:
     team_key: str
     repo_url: str
@@ -35,7 +62,15 @@ class RepoSnapshot:
     commits: list[CommitEntry]
 
 
-@dataclass
+@dataclass(slots=True)
+class TeamSpec:
+    name: str
+    url: str
+    track: str = ""
+    members: str = ""
+
+
+@dataclass(slots=True)
 class RepoAnalysis:
     team_name: str
     repo_url: str
@@ -55,16 +90,51 @@ class GitHubAnalyzer:
         self.token = token or get_github_token()
         self.requests_remaining: Optional[int] = None
         self.requests_limit: Optional[int] = None
+        # Pacing state: each request reserves a start slot under the lock
+        self._rate_lock = threading.Lock()
+        self._rate_spacing = 0.0
+        self._next_request_at = 0.0
+        # One keep-alive session so TLS/TCP setup is paid once per snapshot,
+        # not once per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update(self._headers())
+        # Blob line counts are content-addressed, so they hold across commits
+        self._blob_cache: Dict[str, int] = {}
+        self._tree_totals_cache: Dict[str, tuple[int, int]] = {}
+        # Repo objects from the search batch, keyed by lowercased (owner, repo)
+        self._prefetched_metadata: Dict[tuple[str, str], Dict] = {}
+        # analyze() and analyze_commit_history() hit these for the same repo;
+        # memoized per instance so a new analyzer (next cycle) sees fresh data
+        self._repo_metadata = lru_cache(maxsize=1024)(self._repo_metadata)
+        self._languages = lru_cache(maxsize=1024)(self._languages)
+        self._has_readme = lru_cache(maxsize=1024)(self._has_readme)
+        # Independent endpoints of one repo are fetched concurrently
+        self._pool = ThreadPoolExecutor(max_workers=COMMIT_PAGE_WINDOW, thread_name_prefix="github")
+        # REST blob reads that GraphQL could not resolve
+        self._blob_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="github-blob")
         # Fetch initial rate limit
         self.check_rate_limit()
 
+    def clear_cache(self) -> None:
+        self._repo_metadata.cache_clear()
+        self._languages.cache_clear()
+        self._has_readme.cache_clear()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._blob_pool.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+
     def check_rate_limit(self) -> Dict[str, Optional[int]]:
         """Explicitly check rate limit using the /rate_limit endpoint."""
         url = f"{GITHUB_API_BASE}/rate_limit"
         try:
-            resp = requests.get(url, headers=self._headers(), timeout=10)
+            resp = self._session.get(url, timeout=10)
             if resp.status_code == 200:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 core = data.get("resources", {}).get("core", {})
                 if not core: # Fallback for some API versions
                     core = data.get("rate", {})
@@ -85,6 +155,45 @@ class GitHubAnalyzer:
         if limit is not None:
             self.requests_limit = int(limit)
 
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        spacing = 0.0
+        reserve = min(RATE_LIMIT_RESERVE, self.requests_limit // 10) if self.requests_limit else RATE_LIMIT_RESERVE
+        if int(remaining) < reserve:
+            # Spread what is left of the budget evenly over the rest of the window
+            window = max(0.0, float(reset) - time.time())
+            spacing = window / max(int(remaining), 1)
+        with self._rate_lock:
+            self._rate_spacing = spacing
+
+    def _delay_requests(self, seconds: float) -> None:
+        with self._rate_lock:
+            self._next_request_at = max(self._next_request_at, time.monotonic() + seconds)
+
+    def _wait_for_rate_gate(self) -> None:
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_at)
+            self._next_request_at = start + self._rate_spacing
+        if start > now:
+            time.sleep(start - now)
+
+    def _request(self, method: str, url: str, track_rate_limit: bool = True, **kwargs) -> requests.Response:
+        """Send a paced request, waiting out one Retry-After on 403/429."""
+        self._wait_for_rate_gate()
+        resp = self._session.request(method, url, **kwargs)
+        if track_rate_limit:
+            self._update_rate_limit(resp.headers)
+        retry_after = resp.headers.get("Retry-After")
+        if resp.status_code in (403, 429) and retry_after and retry_after.isdigit():
+            self._delay_requests(int(retry_after))
+            self._wait_for_rate_gate()
+            resp = self._session.request(method, url, **kwargs)
+            if track_rate_limit:
+                self._update_rate_limit(resp.headers)
+        return resp
+
     def get_rate_limit_info(self) -> Dict[str, Optional[int]]:
         """Return current rate limit status."""
         return {
@@ -99,77 +208,213 @@ class GitHubAnalyzer:
         return headers
 
     def _get_json(self, url: str, timeout: int = 12) -> Optional[Dict]:
-        resp = requests.get(url, headers=self._headers(), timeout=timeout)
-        self._update_rate_limit(resp.headers)
+        resp = self._request("GET", url, timeout=timeout)
         if resp.status_code == 404:
             return None
         resp.raise_for_status()
-        return resp.json()
-
-    def _get(self, url: str, timeout: int = 12) -> requests.Response:
-        resp = requests.get(url, headers=self._headers(), timeout=timeout)
-        self._update_rate_limit(resp.headers)
+        return orjson.loads(resp.content)
+
+    def _graphql(self, query: str, variables: Optional[Dict] = None, timeout: int = 30) -> Dict:
+        # GraphQL has its own rate limit budget, so its headers are not tracked here
+        resp = self._request(
+            "POST",
+            GITHUB_GRAPHQL_URL,
+            track_rate_limit=False,
+            json={"query": query, "variables": variables or {}},
+            timeout=timeout,
+        )
+        resp.raise_for_status()
+        return orjson.loads(resp.content).get("data") or {}
+
+    def _get_cached(
+        self, url: str, timeout: int = 12, keep: Optional[Callable[[Any], Any]] = None
+    ) -> tuple[Optional[Any], str]:
+        """Conditional GET backed by the on-disk ETag cache; returns (payload, Link header).
+
+        Unchanged resources come back as 304, which does not count against the
+        core rate limit, and are served from the cache. keep, if given, reduces
+        a fresh payload to what callers need before it is cached and returned.
+        """
+        data, link, _ = self._get_conditional(url, timeout=timeout, keep=keep)
+        return data, link
+
+    def _get_conditional(
+        self, url: str, timeout: int = 12, keep: Optional[Callable[[Any], Any]] = None
+    ) -> tuple[Optional[Any], str, str]:
+        """As _get_cached, plus the resource's current ETag ("" if it has none)."""
+        cached = http_cache.get_response(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        resp = self._request("GET", url, headers=headers, timeout=timeout)
+        if resp.status_code == 304 and cached:
+            return cached[1], cached[2], cached[0]
         if resp.status_code == 404:
-            return resp
+            return None, "", ""
         resp.raise_for_status()
-        return resp
+        data = orjson.loads(resp.content) if resp.content else None
+        if keep is not None:
+            data = keep(data)
+        link = resp.headers.get("Link", "")
+        etag = resp.headers.get("ETag") or ""
+        if etag:
+            http_cache.put_response(url, etag, data, link)
+        return data, link, etag
 
     def _repo_metadata(self, owner: str, repo: str) -> Dict:
+        prefetched = self._prefetched_metadata.get((owner.lower(), repo.lower()))
+        if prefetched is not None:
+            return prefetched
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}"
-        return self._get_json(url) or {}
+        return self._get_cached(url)[0] or {}
+
+    def _repos_metadata_batch(self, pairs: list[tuple[str, str]]) -> Dict[tuple[str, str], Dict]:
+        """Fetch repo objects for many repos through the search API, SEARCH_REPO_BATCH per request.
+
+        Repos the search does not return (or failed batches) are simply missing
+        from the result; _repo_metadata falls back to /repos for them.
+        """
+        found: Dict[tuple[str, str], Dict] = {}
+        unique = list(dict.fromkeys((o.lower(), r.lower()) for o, r in pairs))
+        for start in range(0, len(unique), SEARCH_REPO_BATCH):
+            batch = unique[start:start + SEARCH_REPO_BATCH]
+            query = " ".join(f"repo:{o}/{r}" for o, r in batch)
+            url = f"{GITHUB_API_BASE}/search/repositories?q={quote(query)}&per_page={len(batch)}"
+            try:
+                # Search has its own rate limit budget, so its headers are not tracked
+                resp = self._request("GET", url, track_rate_limit=False, timeout=12)
+                resp.raise_for_status()
+                items = orjson.loads(resp.content).get("items") or []
+            except Exception:
+                continue
+            for item in items:
+                owner, _, repo = str(item.get("full_name", "")).lower().partition("/")
+                if owner and repo:
+                    found[(owner, repo)] = item
+        return found
 
     def _get_tree(self, owner: str, repo: str, sha: str) -> Dict:
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/git/trees/{sha}?recursive=1"
         return self._get_json(url) or {}
 
-    def _get_line_count(self, owner: str, repo: str, blob_sha: str) -> int:
-        if not hasattr(self, '_blob_cache'):
-            self._blob_cache = {}
-        
+    def _tree_totals(self, owner: str, repo: str, tree_sha: str) -> tuple[int, int]:
+        """Return (total_files, total_lines) for a tree, fetching each distinct tree once."""
+        cached = self._tree_totals_cache.get(tree_sha) or http_cache.get_tree_totals(tree_sha)
+        if cached is not None:
+            self._tree_totals_cache[tree_sha] = cached
+            return cached
+
+        tree = self._get_tree(owner, repo, tree_sha)
+        total_files = 0
+        blob_shas: list[str] = []
+        for item in tree.get("tree", []):
+            if item.get("type") == "blob":
+                total_files += 1
+                # Explicitly check for code files
+                if not self._is_binary(item.get("path", "")):
+                    blob_shas.append(item.get("sha"))
+
+        counts = self._line_counts(owner, repo, set(blob_shas))
+        totals = (total_files, sum(counts.get(b, 0) for b in blob_shas))
+        # A blob that failed to load (rate limit, 5xx, timeout) would undercount
+        # the tree for good, so only fully resolved totals are cached
+        if tree and all(b in counts for b in blob_shas):
+            self._tree_totals_cache[tree_sha] = totals
+            http_cache.put_tree_totals(tree_sha, totals)
+        return totals
+
+    def _line_counts(self, owner: str, repo: str, blob_shas: set[str]) -> Dict[str, int]:
+        counts = {b: self._blob_cache[b] for b in blob_shas if b in self._blob_cache}
+        missing = [b for b in blob_shas if b not in counts]
+        if missing:
+            # Blob shas are content-addressed, so disk entries never go stale
+            stored = http_cache.get_blob_lines(missing)
+            self._blob_cache.update(stored)
+            counts.update(stored)
+            missing = [b for b in missing if b not in counts]
+        if not missing:
+            return counts
+
+        # GraphQL needs a token but resolves a whole batch of blobs per request
+        if self.token:
+            counts.update(self._line_counts_graphql(owner, repo, missing))
+        rest = [b for b in missing if b not in counts]
+        fetched = zip(rest, self._blob_pool.map(lambda b: self._get_line_count(owner, repo, b), rest))
+        # Failed fetches come back as None and are left out of counts
+        counts.update((b, lines) for b, lines in fetched if lines is not None)
+        http_cache.put_blob_lines({b: self._blob_cache[b] for b in missing if b in self._blob_cache})
+        return counts
+
+    def _line_counts_graphql(self, owner: str, repo: str, blob_shas: list[str]) -> Dict[str, int]:
+        """Count lines for many blobs at once; blobs it cannot resolve are left out."""
+        counts: Dict[str, int] = {}
+        for start in range(0, len(blob_shas), GRAPHQL_BLOB_BATCH):
+            batch = blob_shas[start:start + GRAPHQL_BLOB_BATCH]
+            params = "".join(f", $b{i}: GitObjectID!" for i in range(len(batch)))
+            fields = " ".join(
+                f"b{i}: object(oid: $b{i}) {{ ... on Blob {{ isBinary isTruncated text }} }}" for i in range(len(batch))
+            )
+            query = f"query($owner: String!, $name: String!{params}) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+            variables: Dict[str, str] = {"owner": owner, "name": repo}
+            variables.update({f"b{i}": sha for i, sha in enumerate(batch)})
+            try:
+                data = self._graphql(query, variables)
+            except Exception:
+                continue
+
+            repository = data.get("repository") or {}
+            for i, sha in enumerate(batch):
+                blob = repository.get(f"b{i}")
+                # Truncated text would undercount; leave those to the REST path
+                if not blob or blob.get("isTruncated"):
+                    continue
+                text = "" if blob.get("isBinary") else (blob.get("text") or "")
+                lines = text.count("\n")
+                if text and not text.endswith("\n"):
+                    lines += 1
+                self._blob_cache[sha] = lines
+                counts[sha] = lines
+        return counts
+
+    def _get_line_count(self, owner: str, repo: str, blob_sha: str) -> Optional[int]:
+        """Line count of a blob, or None if it could not be fetched or decoded."""
         if blob_sha in self._blob_cache:
             return self._blob_cache[blob_sha]
 
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/git/blobs/{blob_sha}"
         
         try:
-            resp = requests.get(url, headers=self._headers(), timeout=12)
-            self._update_rate_limit(resp.headers)
+            resp = self._request("GET", url, timeout=12)
             if resp.status_code != 200:
-                return 0
+                return None
             
-            data = resp.json()
+            data = orjson.loads(resp.content)
             # The GitHub API returns content in the 'content' field as a base64 string
             encoded = data.get("content", "")
             if not encoded:
+                self._blob_cache[blob_sha] = 0
                 return 0
                 
-            import base64
             try:
-                # Remove any potential whitespace/newlines in the base64 string
-                cleaned_encoded = "".join(encoded.split())
-                content_bytes = base64.b64decode(cleaned_encoded)
+                # a2b_base64 skips the embedded newlines itself, so the payload is
+                # decoded in one C pass without first copying a cleaned string
+                content_bytes = binascii.a2b_base64(encoded)
                 
                 # Heuristic check if content is binary
                 if self._is_binary_content(content_bytes):
                     self._blob_cache[blob_sha] = 0
                     return 0
 
-                content_str = content_bytes.decode("utf-8", errors="ignore")
-                
-                # Count lines accurately
-                if not content_str:
-                    lines = 0
-                else:
-                    lines = content_str.count('\n')
-                    if not content_str.endswith('\n'):
-                        lines += 1
+                # Count newline bytes directly; b"\n" never occurs inside a
+                # multi-byte UTF-8 sequence, so no text decode is needed
+                lines = content_bytes.count(b'\n')
+                if content_bytes and not content_bytes.endswith(b'\n'):
+                    lines += 1
                 
                 self._blob_cache[blob_sha] = lines
                 return lines
             except Exception:
-                return 0
+                return None
         except Exception:
-            return 0
+            return None
 
     @staticmethod
     def _is_binary_content(content: bytes) -> bool:
@@ -202,39 +447,77 @@ class GitHubAnalyzer:
             
         return ext in binary_extensions
 
-    def _commits_page(self, owner: str, repo: str, branch: str, page: int, per_page: int = 100) -> List[Dict]:
-        url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/commits?per_page={per_page}&sha={branch}&page={page}"
-        data = self._get_json(url)
+    def _commits_page(
+        self,
+        owner: str,
+        repo: str,
+        branch: str,
+        page: int,
+        per_page: int = 100,
+        since_iso: Optional[str] = None,
+        head: str = "",
+    ) -> List[Dict]:
+        """Return one page of commits.
+
+        head is page 1's current ETag. A cached copy fetched under that same
+        head is served without a request; any other page is fetched (with
+        If-None-Match) and recorded against head.
+        """
+        url = self._commits_url(owner, repo, branch, page, per_page, since_iso)
+        if head and http_cache.get_page_head(url) == head:
+            cached = http_cache.get_response(url)
+            if cached:
+                return cached[1] or []
+        data, _, etag = self._get_conditional(url)
+        # Only a copy that is now in the cache may be recorded as current
+        if head and etag:
+            http_cache.put_page_head(url, head)
         return data or []
 
+    @staticmethod
+    def _commits_url(owner: str, repo: str, branch: str, page: int, per_page: int, since_iso: Optional[str]) -> str:
+        # An empty branch lets GitHub use the default branch
+        url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/commits?per_page={per_page}&page={page}"
+        if branch:
+            url += f"&sha={branch}"
+        if since_iso:
+            url += f"&since={since_iso}"
+        return url
+
     def _commit_count(self, owner: str, repo: str, branch: str) -> int:
-        url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/commits?per_page=1&sha={branch}"
-        resp = self._get(url)
-        if resp.status_code == 404:
+        url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/commits?per_page=1"
+        if branch:
+            url += f"&sha={branch}"
+        data, link = self._get_cached(url)
+        if data is None:
             return 0
+        return self._last_page(link) or (1 if data else 0)
 
-        link = resp.headers.get("Link", "")
+    @staticmethod
+    def _last_page(link: str) -> Optional[int]:
+        """Page number of the Link header's rel="last" target, if there is one."""
         if "rel=\"last\"" in link:
             # ...page=N>; rel="last"
-            parts = [p.strip() for p in link.split(",")]
-            for part in parts:
-                if "rel=\"last\"" in part:
-                    match = re.search(r"[?&]page=(\d+)", part)
+            for part in link.split(","):
+                target, _, rel = part.rpartition(";")
+                if "rel=\"last\"" in rel:
+                    match = _LAST_PAGE_RE.search(target)
                     if match:
                         return int(match.group(1))
-        data = resp.json() if resp.content else []
-        return 1 if data else 0
+        return None
 
     def _languages(self, owner: str, repo: str) -> Dict[str, int]:
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/languages"
-        data = self._get_json(url)
+        data = self._get_cached(url)[0]
         return data or {}
 
     def _has_readme(self, owner: str, repo: str) -> bool:
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/readme"
-        resp = requests.get(url, headers=self._headers(), timeout=10)
-        self._update_rate_limit(resp.headers)
-        return resp.status_code == 200
+        try:
+            # Only presence matters; cache a flag instead of the README body
+            return self._get_cached(url, timeout=10, keep=lambda data: data is not None)[0] is not None
+        except requests.HTTPError:
+            return False
 
     def analyze(self, team_name: str, repo_url: str, track: str, members: str, progress_cb=None) -> RepoAnalysis:
         parsed = parse_repo_from_url(repo_url)
@@ -242,12 +525,19 @@ class GitHubAnalyzer:
             raise ValueError(f"Invalid GitHub URL: {repo_url}")
         owner, repo = parsed
 
-        meta = self._repo_metadata(owner, repo)
+        # None of these depend on each other; the commits endpoint falls back
+        # to the default branch when no sha is given.
+        meta_f = self._pool.submit(self._repo_metadata, owner, repo)
+        commits_f = self._pool.submit(self._commits_page, owner, repo, "", 1, 30)
+        languages_f = self._pool.submit(self._languages, owner, repo)
+        readme_f = self._pool.submit(self._has_readme, owner, repo)
+
+        meta = meta_f.result()
         default_branch = meta.get("default_branch", "main") if meta else "main"
         if progress_cb:
             progress_cb("fetch", 20, f"Repo metadata loaded for {repo}")
 
-        commits = self._commits_page(owner, repo, default_branch, page=1, per_page=30)
+        commits = commits_f.result()
         commit_messages = [c.get("commit", {}).get("message", "") for c in commits]
         last_commit_date = None
         if commits:
@@ -255,11 +545,11 @@ class GitHubAnalyzer:
         if progress_cb:
             progress_cb("fetch", 60, f"Commit history pulled for {repo}")
 
-        languages = self._languages(owner, repo)
+        languages = languages_f.result()
         if progress_cb:
             progress_cb("fetch", 80, f"Languages analyzed for {repo}")
 
-        readme_present = self._has_readme(owner, repo)
+        readme_present = readme_f.result()
         if progress_cb:
             progress_cb("fetch", 100, f"README checked for {repo}")
 
@@ -281,31 +571,70 @@ class GitHubAnalyzer:
             top_languages=top_languages,
         )
 
+    def analyze_many(self, teams: list[TeamSpec], progress_cb=None) -> list[RepoAnalysis | Exception]:
+        """Analyze teams concurrently; results keep input order and failures are returned, not raised."""
+        def one(team: TeamSpec) -> RepoAnalysis:
+            return self.analyze(team.name, team.url, team.track, team.members, progress_cb=progress_cb)
+
+        pairs = [p for p in (parse_repo_from_url(t.url) for t in teams) if p]
+        self._prefetched_metadata.update(self._repos_metadata_batch(pairs))
+
+        # A separate pool: analyze() itself waits on self._pool
+        with ThreadPoolExecutor(max_workers=TEAM_CONCURRENCY, thread_name_prefix="github-team") as pool:
+            futures = [pool.submit(one, t) for t in teams]
+            results: list[RepoAnalysis | Exception] = []
+            for f in futures:
+                try:
+                    results.append(f.result())
+                except Exception as exc:  # pylint: disable=broad-except
+                    results.append(exc)
+        return results
+
     def analyze_commit_history(
         self,
         team_key: str,
         repo_url: str,
         known_shas: Optional[set[str]] = None,
         progress_cb=None,
+        since_iso: Optional[str] = None,
     ) -> RepoSnapshot:
+        """Snapshot repo stats plus commits not in known_shas.
+
+        since_iso (ISO 8601) limits the walk to commits dated after it. GitHub
+        filters on commit date, not push time, so commits made before since_iso
+        but pushed later are skipped; only pass it when that is acceptable.
+        known_shas is still honoured, so an inclusive boundary commit is dropped.
+        """
         parsed = parse_repo_from_url(repo_url)
         if not parsed:
             raise ValueError(f"Invalid GitHub URL: {repo_url}")
         owner, repo = parsed
 
-        meta = self._repo_metadata(owner, repo)
+        meta_f = self._pool.submit(self._repo_metadata, owner, repo)
+        languages_f = self._pool.submit(self._languages, owner, repo)
+        readme_f = self._pool.submit(self._has_readme, owner, repo)
+
+        meta = meta_f.result()
         branch = meta.get("default_branch", "main") if meta else "main"
         if progress_cb:
             progress_cb("fetch", 20, f"Repo metadata loaded for {repo}")
 
-        languages_raw = self._languages(owner, repo)
-        languages = self._format_languages(languages_raw)
-        readme_present = self._has_readme(owner, repo)
-        total_commits = self._commit_count(owner, repo, branch)
+        languages = self._format_languages(languages_f.result())
+        readme_present = readme_f.result()
         if progress_cb:
             progress_cb("fetch", 50, f"Snapshot ready for {repo}")
 
-        new_commits = self._fetch_new_commits(owner, repo, branch, known_shas or set(), progress_cb=progress_cb)
+        new_commits, total_commits = self._fetch_new_commits(
+            owner,
+            repo,
+            branch,
+            known_shas or set(),
+            progress_cb=progress_cb,
+            since_iso=since_iso,
+        )
+        if total_commits is None:
+            # The walk stopped early, so the history length is still unknown
+            total_commits = self._commit_count(owner, repo, branch)
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
         if progress_cb:
@@ -331,75 +660,119 @@ class GitHubAnalyzer:
         branch: str,
         known_shas: set[str],
         progress_cb=None,
-    ) -> list[CommitEntry]:
+        since_iso: Optional[str] = None,
+    ) -> tuple[list[CommitEntry], Optional[int]]:
+        """Return new commits (oldest first) and the branch's commit count if the walk saw all of it."""
         results: list[CommitEntry] = []
-        page = 1
-        while True:
-            commits = self._commits_page(owner, repo, branch, page=page, per_page=100)
-            if not commits:
-                break
-
-            stop = False
-            for c in commits:
-                sha = str(c.get("sha", "")).strip()
-                if not sha:
-                    continue
-                if sha in known_shas:
-                    stop = True
-                    break
-
-                commit = c.get("commit", {}) or {}
-                message = str(commit.get("message", "")).replace("\n", " ").strip()
-                author = str((commit.get("author") or {}).get("name") or "")
-                if not author:
-                    author = str((commit.get("committer") or {}).get("name") or "")
-                date_utc = str((commit.get("author") or {}).get("date") or "")
-                if not date_utc:
-                    date_utc = str((commit.get("committer") or {}).get("date") or "")
-
-                # Fetch tree for this commit to count files and calculate total lines
-                tree = self._get_tree(owner, repo, sha)
-                total_files = 0
-                total_lines = 0
-                
-                if tree and "tree" in tree:
-                    for item in tree["tree"]:
-                        if item.get("type") == "blob":
-                            total_files += 1
-                            path = item.get("path", "")
-                            # Explicitly check for code files
-                            if not self._is_binary(path):
-                                blob_sha = item.get("sha")
-                                lines = self._get_line_count(owner, repo, blob_sha)
-                                total_lines += lines
-                
-                results.append(CommitEntry(
-                    sha=sha, 
-                    message=message, 
-                    author=author, 
-                    date_utc=date_utc,
-                    total_lines=total_lines,
-                    total_files=total_files
-                ))
-
-            if progress_cb:
-                progress_cb("fetch", min(95, 50 + page * 10), f"Pulled commits page {page} for {repo}")
-
-            if stop:
-                break
-            page += 1
+        collected, total_commits = self._collect_new_commits(owner, repo, branch, known_shas, progress_cb, since_iso)
+        for sha, c in collected:
+            commit = c.get("commit") or _EMPTY
+            author_info = commit.get("author") or _EMPTY
+            committer_info = commit.get("committer") or _EMPTY
+            message = str(commit.get("message", "")).replace("\n", " ").strip()
+            author = str(author_info.get("name") or committer_info.get("name") or "")
+            date_utc = str(author_info.get("date") or committer_info.get("date") or "")
+
+            # Identical trees (and blobs) recur across commits; totals are cached per tree sha
+            tree_sha = str((commit.get("tree") or _EMPTY).get("sha") or sha)
+            total_files, total_lines = self._tree_totals(owner, repo, tree_sha)
+
+            results.append(CommitEntry(
+                sha=sha, 
+                message=message, 
+                author=author, 
+                date_utc=date_utc,
+                total_lines=total_lines,
+                total_files=total_files
+            ))
 
         # API returns newest-first; append in chronological order for nicer history
         results.reverse()
-        return results
+        return results, total_commits
+
+    def _collect_new_commits(
+        self,
+        owner: str,
+        repo: str,
+        branch: str,
+        known_shas: set[str],
+        progress_cb=None,
+        since_iso: Optional[str] = None,
+    ) -> tuple[list[tuple[str, Dict]], Optional[int]]:
+        """Return (sha, commit) pairs newer than known_shas, newest first, and the total.
+
+        Page 1 is requested alone (most repos fit in it), then pages are requested
+        COMMIT_PAGE_WINDOW at a time, capped at the last page named in page 1's
+        Link header, and consumed in order, stopping at the first known sha or
+        the last page. The total commit count is only known when the
+        whole unfiltered history was walked; otherwise it is None.
+        """
+        per_page = 100
+        collected: list[tuple[str, Dict]] = []
+        total: Optional[int] = None
+        page = 1
+        done = False
+        head = ""
+        last_page = 1
+        while not done:
+            if page == 1:
+                end = 2
+                url = self._commits_url(owner, repo, branch, 1, per_page, since_iso)
+                first, link, head = self._get_conditional(url)
+                fetched = [first or []]
+                last_page = self._last_page(link) or 1
+            else:
+                # Never ask past the last page page 1's Link header announced
+                end = min(page + COMMIT_PAGE_WINDOW, last_page + 1)
+                if end <= page:
+                    # Every page so far was full and there are no more
+                    total = (page - 1) * per_page
+                    break
+                # Page 1's ETag identifies the branch head; later pages cached
+                # under that same head are served without a request
+                fetched = self._pool.map(
+                    lambda p: self._commits_page(
+                        owner, repo, branch, page=p, per_page=per_page, since_iso=since_iso, head=head
+                    ),
+                    range(page, end),
+                )
+            for current, commits in zip(range(page, end), fetched):
+                if not commits:
+                    total = (current - 1) * per_page
+                    done = True
+                    break
+
+                stopped = False
+                for c in commits:
+                    sha = str(c.get("sha", "")).strip()
+                    if not sha:
+                        continue
+                    if sha in known_shas:
+                        stopped = True
+                        break
+                    collected.append((sha, c))
+
+                if progress_cb:
+                    progress_cb("fetch", min(95, 50 + current * 10), f"Pulled commits page {current} for {repo}")
+
+                if stopped:
+                    done = True
+                    break
+                if len(commits) < per_page:
+                    total = (current - 1) * per_page + len(commits)
+                    done = True
+                    break
+            page = end
+        # A since= filter hides older commits, so the walk cannot size the history
+        if since_iso:
+            total = None
+        return collected, total
 
     @staticmethod
     def _format_languages(data: Dict[str, int]) -> str:
         if not data:
             return ""
         total = sum(data.values())
-        parts = []
-        for lang, size in sorted(data.items(), key=lambda i: i[1], reverse=True):
-            pct = (size / total * 100) if total else 0
-            parts.append(f"{lang} ({pct:.0f}%)")
-        return ", ".join(parts)
+        items = sorted(data.items(), key=itemgetter(1), reverse=True)
+        # size / total * 100, not size * (100 / total): the two round differently
+        return ", ".join(f"{lang} ({(size / total * 100) if total else 0:.0f}%)" for lang, size in items)
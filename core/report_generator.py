@@ -1,28 +1,60 @@
 from __future__ import annotations
 
-import pandas as pd
+from typing import TYPE_CHECKING
+
+from openpyxl import Workbook
 
 from utils.constants import EXCEL_COLUMNS
 from core.github_analyzer import RepoAnalysis
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def to_dataframe(results: list[RepoAnalysis]) -> pd.DataFrame:
-    rows = []
+
+def _report_row(r: RepoAnalysis) -> list:
+    return [
+        r.team_name,
+        r.repo_url,
+        r.track,
+        r.members,
+        "Private" if r.is_private else "Public",
+        r.default_branch,
+        r.total_commits,
+        r.last_commit,
+        r.recent_messages,
+        "Yes" if r.readme_present else "No",
+        r.top_languages,
+    ]
+
+
+def write_report(results: list[RepoAnalysis], path: str) -> None:
+    """Stream results straight into an .xlsx without building a DataFrame."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Report")
+    ws.append(EXCEL_COLUMNS)
     for r in results:
-        rows.append(
-            {
-                "Team Name": r.team_name,
-                "GitHub Repo URL": r.repo_url,
-                "Track": r.track,
-                "Members": r.members,
-                "Public/Private": "Private" if r.is_private else "Public",
-                "Default Branch": r.default_branch,
-                "Total Commits": r.total_commits,
-                "Last Commit": r.last_commit,
-                "Recent Messages": r.recent_messages,
-                "README Present": "Yes" if r.readme_present else "No",
-                "Top Languages": r.top_languages,
-            }
-        )
-    df = pd.DataFrame(rows, columns=EXCEL_COLUMNS)
+        ws.append(_report_row(r))
+    wb.save(path)
+
+
+def to_dataframe(results: list[RepoAnalysis]) -> pd.DataFrame:
+    # pandas is only imported by callers that actually want a DataFrame
+    import pandas as pd
+
+    # One list per column; pandas builds each column directly instead of
+    # re-laying out a list of per-row dicts
+    columns = {
+        "Team Name": [r.team_name for r in results],
+        "GitHub Repo URL": [r.repo_url for r in results],
+        "Track": [r.track for r in results],
+        "Members": [r.members for r in results],
+        "Public/Private": ["Private" if r.is_private else "Public" for r in results],
+        "Default Branch": [r.default_branch for r in results],
+        "Total Commits": [r.total_commits for r in results],
+        "Last Commit": [r.last_commit for r in results],
+        "Recent Messages": [r.recent_messages for r in results],
+        "README Present": ["Yes" if r.readme_present else "No" for r in results],
+        "Top Languages": [r.top_languages for r in results],
+    }
+    df = pd.DataFrame(columns, columns=EXCEL_COLUMNS)
     return df
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import time
 from typing import Callable, Optional
 
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
 
-from utils.helpers import safe_interval_seconds
+from utils.helpers import safe_interval_hours, safe_interval_seconds
 
 
 class Scheduler(QObject):
@@ -15,29 +16,53 @@ class Scheduler(QObject):
         super().__init__(parent)
         self._interval_seconds = 0
         self._countdown = 0
+        # Next run on the monotonic clock; the countdown is derived from it so
+        # late or skipped timer ticks never make the schedule drift
+        self._deadline = 0.0
+        # Last value sent on tick; repeats are dropped to spare the listeners
+        self._last_emitted = -1
         self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._timer.setInterval(1000)
         self._timer.timeout.connect(self._on_tick)
 
     def start(self, seconds: int) -> None:
         self._interval_seconds = safe_interval_seconds(seconds)
+        self._deadline = time.monotonic() + self._interval_seconds
         self._countdown = 0
+        self._last_emitted = -1
         self._emit_tick()
         self._timer.start()
-        self.triggered.emit()  # immediate run
+        # Immediate run, queued so start() returns before a slow slot runs
+        QTimer.singleShot(0, self._trigger_now)
+
+    def start_hours(self, hours: float) -> None:
+        self.start(int(safe_interval_hours(hours) * 3600))
 
     def stop(self) -> None:
         self._timer.stop()
         self._countdown = 0
         self._emit_tick()
 
+    def _trigger_now(self) -> None:
+        # Skip the queued run if stop() came first
+        if self._timer.isActive():
+            self.triggered.emit()
+
     def _on_tick(self) -> None:
-        if self._countdown <= 0:
-            self._countdown = self._interval_seconds
+        now = time.monotonic()
+        # Rounded so a tick landing a few ms early still counts as due
+        if round(self._deadline - now) <= 0:
             self.triggered.emit()
-        else:
-            self._countdown -= 1
+            self._deadline += self._interval_seconds
+            # Catch up if the event loop was blocked past several intervals
+            while self._deadline <= now:
+                self._deadline += self._interval_seconds
+        self._countdown = round(self._deadline - now)
         self._emit_tick()
 
     def _emit_tick(self) -> None:
-        self.tick.emit(max(self._countdown, 0))
+        value = max(self._countdown, 0)
+        if value != self._last_emitted:
+            self._last_emitted = value
+            self.tick.emit(value)
@@ -1,24 +1,41 @@
 from pathlib import Path
-from typing import Optional
 
 import pandas as pd
-from openpyxl import Workbook, load_workbook
 
 from utils.constants import EXCEL_COLUMNS
-from utils.constants import COMMIT_HISTORY_HEADERS
+
+# Parsed team lists keyed by path, with the (mtime, size) they were read at;
+# monitoring cycles re-read the same unchanged file every tick
+_excel_cache: dict[str, tuple[int, int, pd.DataFrame]] = {}
 
 
 def read_excel(path: str) -> pd.DataFrame:
     file_path = Path(path)
-    if not file_path.exists():
+    try:
+        st = file_path.stat()
+    except OSError:
         return pd.DataFrame(columns=EXCEL_COLUMNS)
-    df = pd.read_excel(file_path)
-    # Ensure all required source columns exist
+    cached = _excel_cache.get(str(file_path))
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2].copy()
+    df = _parse_excel(file_path)
+    _excel_cache[str(file_path)] = (st.st_mtime_ns, st.st_size, df)
+    return df.copy()
+
+
+def _parse_excel(file_path: Path) -> pd.DataFrame:
     required_cols = ["Team Name", "GitHub Repo URL", "Track", "Members"]
-    for col in required_cols:
-        if col not in df.columns:
-            df[col] = ""
-    return df[required_cols]
+    # Parse only the source columns, as plain strings; a callable usecols also
+    # tolerates sheets that lack some of them
+    df = pd.read_excel(
+        file_path,
+        usecols=lambda col: col in required_cols,
+        dtype=str,
+        engine="openpyxl",
+        na_filter=False,
+    )
+    # Ensure all required source columns exist, in one reindex
+    return df.reindex(columns=required_cols, fill_value="")
 
 
 def is_valid_excel(path: str) -> bool:
@@ -1,5 +1,8 @@
 import os
 import re
+import threading
+from collections import OrderedDict
+from itertools import count
 from typing import Iterable, Optional
 
 import gspread
@@ -15,52 +18,137 @@ SCOPES = [
 ]
 
 
-def _get_credentials(service_account_path: Optional[str] = None) -> Credentials:
+# Credentials, authorized clients and opened spreadsheets are reused across
+# calls so each tick skips the key file read, OAuth exchange and open_by_url
+_SPREADSHEET_CACHE_SIZE = 32
+_cache_lock = threading.Lock()
+_credentials_cache: dict[str, Credentials] = {}
+_client_cache: dict[str, gspread.Client] = {}
+_spreadsheet_cache: OrderedDict[tuple[str, str], gspread.Spreadsheet] = OrderedDict()
+
+
+def _service_account_path(service_account_path: Optional[str] = None) -> str:
     json_path = service_account_path or os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON", "").strip()
     if not json_path:
         raise ValueError("Service account JSON path not provided. Set GOOGLE_SERVICE_ACCOUNT_JSON or pass path explicitly.")
-    credentials = Credentials.from_service_account_file(json_path, scopes=SCOPES)
+    return json_path
+
+
+def _get_credentials(service_account_path: Optional[str] = None) -> Credentials:
+    json_path = _service_account_path(service_account_path)
+    with _cache_lock:
+        credentials = _credentials_cache.get(json_path)
+        if credentials is None:
+            credentials = Credentials.from_service_account_file(json_path, scopes=SCOPES)
+            _credentials_cache[json_path] = credentials
     if credentials and credentials.expired and credentials.refresh_token:
         credentials.refresh(Request())
     return credentials
 
 
+def _get_client(service_account_path: Optional[str] = None) -> gspread.Client:
+    json_path = _service_account_path(service_account_path)
+    creds = _get_credentials(json_path)
+    with _cache_lock:
+        client = _client_cache.get(json_path)
+        if client is None:
+            # The authorized session refreshes its token on its own
+            client = gspread.authorize(creds)
+            _client_cache[json_path] = client
+    return client
+
+
 def read_sheet(sheet_url: str, worksheet: Optional[str] = None, service_account_path: Optional[str] = None) -> pd.DataFrame:
-    creds = _get_credentials(service_account_path)
-    client = gspread.authorize(creds)
-    sh = client.open_by_url(sheet_url)
+    sh = _open_spreadsheet(sheet_url, service_account_path=service_account_path)
     ws = sh.worksheet(worksheet) if worksheet else sh.sheet1
-    records = ws.get_all_records()
-    df = pd.DataFrame(records)
-    for col in EXCEL_COLUMNS:
-        if col not in df.columns:
-            df[col] = ""
-    return df[EXCEL_COLUMNS]
+    # Build the frame straight from the row lists instead of one dict per row
+    values = ws.get_all_values()
+    df = pd.DataFrame(values[1:], columns=values[0]) if values else pd.DataFrame()
+    # One reindex adds every missing column and fixes the order in a single copy
+    return df.reindex(columns=EXCEL_COLUMNS, fill_value="")
 
 
 def write_sheet(sheet_url: str, df: pd.DataFrame, worksheet: Optional[str] = None, service_account_path: Optional[str] = None) -> None:
-    creds = _get_credentials(service_account_path)
-    client = gspread.authorize(creds)
-    sh = client.open_by_url(sheet_url)
+    sh = _open_spreadsheet(sheet_url, service_account_path=service_account_path)
     ws = sh.worksheet(worksheet) if worksheet else sh.sheet1
     ws.clear()
     ws.update([df.columns.values.tolist()] + df.values.tolist())
 
 
 def update_rows(sheet_url: str, new_df: pd.DataFrame, worksheet: Optional[str] = None, service_account_path: Optional[str] = None) -> None:
+    sh = _open_spreadsheet(sheet_url, service_account_path=service_account_path)
+    ws = sh.worksheet(worksheet) if worksheet else sh.sheet1
+    if upsert_rows(ws, new_df):
+        return
+
+    # Sheet layout differs from EXCEL_COLUMNS: fall back to a full rewrite
     current = read_sheet(sheet_url, worksheet=worksheet, service_account_path=service_account_path)
-    if current.empty:
-        merged = new_df
-    else:
-        merged = pd.concat([current, new_df], ignore_index=True)
-        merged.drop_duplicates(subset=["Team Name", "GitHub Repo URL"], keep="last", inplace=True)
+    merged = new_df if current.empty else _merge_rows(current, new_df)
     write_sheet(sheet_url, merged[EXCEL_COLUMNS], worksheet=worksheet, service_account_path=service_account_path)
 
 
+def _row_key(values) -> tuple[str, str]:
+    return str(values[0]).strip(), str(values[1]).strip()
+
+
+def _merge_rows(current: pd.DataFrame, new_df: pd.DataFrame) -> pd.DataFrame:
+    """Merge new_df over current by (Team Name, GitHub Repo URL), keeping the last row per key."""
+    merged: dict[tuple[str, str], tuple] = {}
+    for frame in (current, new_df):
+        for values in frame[EXCEL_COLUMNS].itertuples(index=False, name=None):
+            key = _row_key(values)
+            # Re-insert so the survivor sits at its last position, as keep="last" does
+            merged.pop(key, None)
+            merged[key] = values
+    return pd.DataFrame(list(merged.values()), columns=EXCEL_COLUMNS)
+
+
+def upsert_rows(ws, new_df: pd.DataFrame) -> bool:
+    """Update rows in place by (Team Name, GitHub Repo URL) and append unseen ones.
+
+    Reads only the header and the two key columns, then issues one batch update
+    and one append. Returns False without writing when the header is not
+    exactly EXCEL_COLUMNS, since the key columns cannot then be located.
+    """
+    header_range, key_range = ws.batch_get(["1:1", "A2:B"])
+    header = header_range[0] if header_range else []
+    if header and header != EXCEL_COLUMNS:
+        return False
+
+    # Key columns A and B map to a 1-based sheet row (data starts at row 2)
+    existing: dict[tuple[str, str], int] = {}
+    for offset, key_row in enumerate(key_range, start=2):
+        existing[_row_key(list(key_row) + ["", ""])] = offset
+
+    updates: list[dict] = []
+    appends: dict[tuple[str, str], list] = {}
+    for values in new_df[EXCEL_COLUMNS].values.tolist():
+        key = _row_key(values)
+        row = existing.get(key)
+        if row is None:
+            # Later duplicates within new_df replace earlier ones, like keep="last"
+            appends.pop(key, None)
+            appends[key] = values
+        else:
+            updates.append({"range": f"A{row}", "values": [values]})
+
+    if not header:
+        ws.update(values=[EXCEL_COLUMNS], range_name="A1", value_input_option="RAW")
+    if updates:
+        ws.batch_update(updates, value_input_option="RAW")
+    if appends:
+        ws.append_rows(list(appends.values()), value_input_option="RAW")
+    return True
+
+
+# Characters Google Sheets rejects in worksheet titles
+_INVALID_TITLE_CHARS = re.compile(r"[\\/\?\*\[\]:]")
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+
 def sanitize_worksheet_title(value: str) -> str:
     title = (value or "").strip()
-    title = re.sub(r"[\\/\?\*\[\]:]", " ", title)
-    title = re.sub(r"\s+", " ", title).strip()
+    title = _WHITESPACE_RUN.sub(" ", _INVALID_TITLE_CHARS.sub(" ", title)).strip()
     if not title:
         title = "Team"
     if len(title) > 100:
@@ -69,9 +157,58 @@ def sanitize_worksheet_title(value: str) -> str:
 
 
 def _open_spreadsheet(sheet_url: str, service_account_path: Optional[str] = None):
-    creds = _get_credentials(service_account_path)
-    client = gspread.authorize(creds)
-    return client.open_by_url(sheet_url)
+    key = (_service_account_path(service_account_path), sheet_url)
+    with _cache_lock:
+        sh = _spreadsheet_cache.get(key)
+        if sh is not None:
+            _spreadsheet_cache.move_to_end(key)
+            return sh
+    sh = _get_client(service_account_path).open_by_url(sheet_url)
+    with _cache_lock:
+        _spreadsheet_cache[key] = sh
+        while len(_spreadsheet_cache) > _SPREADSHEET_CACHE_SIZE:
+            _spreadsheet_cache.popitem(last=False)
+    return sh
+
+
+# Worksheet titles per spreadsheet id, kept next to the cached handles so a
+# new team sheet does not list every worksheet again
+_title_cache: dict[str, set[str]] = {}
+
+
+def _worksheet_titles(sh) -> set[str]:
+    with _cache_lock:
+        titles = _title_cache.get(sh.id)
+    if titles is None:
+        titles = {w.title for w in sh.worksheets()}
+        with _cache_lock:
+            titles = _title_cache.setdefault(sh.id, titles)
+    return titles
+
+
+# Worksheets created without their header row yet, keyed by (spreadsheet id, sheet id)
+_pending_headers: dict[tuple[str, int], gspread.Spreadsheet] = {}
+
+
+def _create_team_worksheet(sh, base: str):
+    title = base
+    existing_titles = _worksheet_titles(sh)
+    with _cache_lock:
+        if title in existing_titles:
+            title = next(f"{base} {i}" for i in count(2) if f"{base} {i}" not in existing_titles)
+    try:
+        ws = sh.add_worksheet(title=title, rows=1000, cols=len(COMMIT_HISTORY_HEADERS))
+    except Exception:
+        # The cached titles may be stale (sheet edited elsewhere): refetch next time
+        with _cache_lock:
+            _title_cache.pop(sh.id, None)
+        raise
+    with _cache_lock:
+        existing_titles.add(ws.title)
+    # A fresh sheet is known to be empty: skip the header read and let the
+    # first append write header and rows in one request
+    _pending_headers[(sh.id, ws.id)] = sh
+    return ws
 
 
 def get_or_create_team_worksheet(
@@ -84,18 +221,10 @@ def get_or_create_team_worksheet(
     try:
         ws = sh.worksheet(base)
     except Exception:
-        title = base
-        existing_titles = {w.title for w in sh.worksheets()}
-        if title in existing_titles:
-            idx = 2
-            while True:
-                candidate = f"{base} {idx}"
-                if candidate not in existing_titles:
-                    title = candidate
-                    break
-                idx += 1
-        ws = sh.add_worksheet(title=title, rows=1000, cols=len(COMMIT_HISTORY_HEADERS))
+        return _create_team_worksheet(sh, base)
 
+    if (sh.id, ws.id) in _pending_headers:
+        return ws
     values = ws.row_values(1)
     if not values:
         ws.update([COMMIT_HISTORY_HEADERS])
@@ -105,21 +234,180 @@ def get_or_create_team_worksheet(
 
 
 def get_existing_commit_shas(ws) -> set[str]:
+    return get_history_state(ws)[0]
+
+
+def get_history_state(ws) -> tuple[set[str], int]:
+    """Return the Sno values already in column A and the first free row after them.
+
+    Every history block ends with a non-empty cell in column A (a Sno or the
+    "-" separator), so the column length marks the end of the sheet's data.
+    """
+    if (ws.spreadsheet_id, ws.id) in _pending_headers:
+        return set(), 2
     values = ws.col_values(1)
     if not values:
-        return set()
+        return set(), 1
     shas = {v.strip() for v in values[1:] if v and str(v).strip()}
-    return shas
+    return shas, len(values) + 1
 
 
-def append_commit_history_rows(ws, rows: list[list[str]]) -> None:
+# Even, so a sheet's header and Sno ranges always share a request
+_BATCH_GET_RANGES = 100
+
+
+def prepare_team_worksheets(
+    sheet_url: str,
+    team_titles: Iterable[str],
+    service_account_path: Optional[str] = None,
+) -> dict[str, tuple]:
+    """Resolve every team's worksheet and history state with batched reads.
+
+    Returns team title -> (worksheet, Sno values, first free row), as
+    get_or_create_team_worksheet and get_history_state would per team. One
+    worksheets() listing finds the existing sheets, and one values_batch_get
+    reads their header rows and Sno columns. Missing or stale headers are
+    rewritten in a single values_batch_update.
+    """
+    sh = _open_spreadsheet(sheet_url, service_account_path=service_account_path)
+    worksheets = sh.worksheets()
+    by_title = {w.title: w for w in worksheets}
+    with _cache_lock:
+        _title_cache[sh.id] = set(by_title)
+
+    team_sheets = {}
+    for team_title in team_titles:
+        base = sanitize_worksheet_title(team_title)
+        ws = by_title.get(base)
+        if ws is None:
+            ws = by_title[base] = _create_team_worksheet(sh, base)
+        team_sheets[team_title] = ws
+
+    # Each distinct sheet once; freshly created ones are known to be empty
+    states: dict[int, tuple[set[str], int]] = {}
+    to_read = []
+    for ws in team_sheets.values():
+        if ws.id in states:
+            continue
+        states[ws.id] = (set(), 2)
+        if (sh.id, ws.id) not in _pending_headers:
+            to_read.append(ws)
+
+    if to_read:
+        ranges = [r for ws in to_read for r in (_a1(ws, "1:1"), _a1(ws, "A:A"))]
+        value_ranges: list[dict] = []
+        # Ranges travel in the query string, so very large teams lists are split
+        for start in range(0, len(ranges), _BATCH_GET_RANGES):
+            batch = ranges[start:start + _BATCH_GET_RANGES]
+            value_ranges.extend(sh.values_batch_get(batch).get("valueRanges", []))
+        header_fixes = []
+        for i, ws in enumerate(to_read):
+            header_rows = value_ranges[2 * i].get("values", [])
+            column = value_ranges[2 * i + 1].get("values", [])
+            header = header_rows[0] if header_rows else []
+            shas = {row[0].strip() for row in column[1:] if row and row[0].strip()}
+            next_row = len(column) + 1
+            if header != COMMIT_HISTORY_HEADERS:
+                header_fixes.append({"range": _a1(ws, "A1"), "values": [COMMIT_HISTORY_HEADERS]})
+                next_row = max(next_row, 2)
+            states[ws.id] = (shas, next_row)
+        if header_fixes:
+            sh.values_batch_update(body={"valueInputOption": "RAW", "data": header_fixes})
+
+    return {title: (ws, *states[ws.id]) for title, ws in team_sheets.items()}
+
+
+def _history_block(rows: list[list[str]]) -> list[list[str]]:
     # Always append a blank row first to separate from the last session
     blank_row = [""] * len(COMMIT_HISTORY_HEADERS)
     
     if not rows:
         # If no new commits, add blank row then a row with dashes
         separator_row = ["-"] * len(COMMIT_HISTORY_HEADERS)
-        ws.append_rows([blank_row, separator_row], value_input_option="RAW")
-    else:
-        # If new commits found, add blank row then the commit data
-        ws.append_rows([blank_row] + rows, value_input_option="RAW")
+        return [blank_row, separator_row]
+    # If new commits found, add blank row then the commit data
+    return [blank_row] + rows
+
+
+def _a1(ws, cell: str) -> str:
+    title = ws.title.replace("'", "''")
+    return f"'{title}'!{cell}"
+
+
+def append_commit_history_rows(ws, rows: list[list[str]]) -> None:
+    block = _history_block(rows)
+
+    sh = _pending_headers.pop((ws.spreadsheet_id, ws.id), None)
+    # values.batchUpdate cannot grow the grid, append_rows can
+    if sh is not None and 1 + len(block) > ws.row_count:
+        ws.update(values=[COMMIT_HISTORY_HEADERS], range_name="A1", value_input_option="RAW")
+        sh = None
+    if sh is None:
+        ws.append_rows(block, value_input_option="RAW")
+        return
+
+    # New worksheet: header and first block go out in one values.batchUpdate
+    sh.values_batch_update(
+        body={
+            "valueInputOption": "RAW",
+            "data": [
+                {"range": _a1(ws, "A1"), "values": [COMMIT_HISTORY_HEADERS]},
+                {"range": _a1(ws, "A2"), "values": block},
+            ],
+        }
+    )
+
+
+def append_commit_history_batch(
+    sheet_url: str,
+    entries: Iterable[tuple],
+    service_account_path: Optional[str] = None,
+) -> None:
+    """Write every team's history block in one values.batchUpdate.
+
+    entries holds (worksheet, first free row, rows) as returned alongside
+    get_history_state. Worksheets that would overflow their grid are grown
+    first with a single spreadsheet batch_update. If the batched write is
+    rejected, each worksheet falls back to append_commit_history_rows.
+    """
+    data: list[dict] = []
+    per_sheet: dict[int, tuple] = {}
+    next_rows: dict[int, int] = {}
+    written: dict[int, set[str]] = {}
+    for ws, start_row, rows in entries:
+        # Teams sharing a worksheet are stacked one after another; their Snos
+        # were read before any of them was written, so drop the ones an
+        # earlier team's block already carries
+        seen = written.setdefault(ws.id, set())
+        rows = [r for r in rows if not (r and r[0] in seen)]
+        seen.update(r[0] for r in rows if r and r[0])
+        row = next_rows.get(ws.id, start_row)
+        block = _history_block(rows)
+        if ws.id not in next_rows and (ws.spreadsheet_id, ws.id) in _pending_headers:
+            data.append({"range": _a1(ws, "A1"), "values": [COMMIT_HISTORY_HEADERS]})
+        data.append({"range": _a1(ws, f"A{row}"), "values": block})
+        next_rows[ws.id] = row + len(block)
+        per_sheet.setdefault(ws.id, (ws, []))[1].append(rows)
+
+    if not data:
+        return
+    grow: list[dict] = []
+    for ws, _ in per_sheet.values():
+        needed = next_rows[ws.id] - 1
+        if needed > ws.row_count:
+            grow.append(
+                {"appendDimension": {"sheetId": ws.id, "dimension": "ROWS", "length": needed - ws.row_count}}
+            )
+
+    sh = _open_spreadsheet(sheet_url, service_account_path=service_account_path)
+    try:
+        if grow:
+            sh.batch_update({"requests": grow})
+        sh.values_batch_update(body={"valueInputOption": "RAW", "data": data})
+    except gspread.exceptions.APIError:
+        for ws, blocks in per_sheet.values():
+            for rows in blocks:
+                append_commit_history_rows(ws, rows)
+        return
+    for ws, _ in per_sheet.values():
+        _pending_headers.pop((ws.spreadsheet_id, ws.id), None)
@@ -0,0 +1,10 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+# A single writer thread: writes run in submission order and never block the
+# producer (the analysis worker) on slow disk or Sheets round-trips
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="io-writer")
+
+
+def submit(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    return _writer.submit(fn, *args, **kwargs)
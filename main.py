@@ -18,14 +18,14 @@ Logo:
 """
 
 import sys
-from pathlib import Path
 
 from dotenv import load_dotenv
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QApplication
 
 from ui.main_window import MainWindow
-from utils.constants import APP_NAME, LOGO_PATH
+from utils.assets import logo_pixmap
+from utils.constants import APP_NAME
 
 
 def main() -> None:
@@ -34,8 +34,9 @@ def main() -> None:
     app.setApplicationName(APP_NAME)
 
     window = MainWindow()
-    if Path(LOGO_PATH).exists():
-        window.setWindowIcon(QIcon(str(LOGO_PATH)))
+    logo = logo_pixmap()
+    if logo is not None:
+        window.setWindowIcon(QIcon(logo))
     window.show()
 
     sys.exit(app.exec())
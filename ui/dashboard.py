@@ -4,7 +4,6 @@ from pathlib import Path
 from typing import Optional
 
 from PyQt6.QtCore import pyqtSignal
-from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import (
     QFileDialog,
     QGridLayout,
@@ -21,7 +20,8 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
 )
 
-from utils.constants import APP_NAME, LOGO_PATH, STATUS_PHASES
+from utils.assets import scaled_logo
+from utils.constants import APP_NAME, STATUS_PHASES
 
 
 class Dashboard(QWidget):
@@ -63,8 +63,8 @@ class Dashboard(QWidget):
         logo_label = QLabel()
         logo_label.setFixedSize(38, 38)
         logo_label.setStyleSheet("border-radius: 10px; background: #1f2937;")
-        if Path(LOGO_PATH).exists():
-            pixmap = QPixmap(str(LOGO_PATH)).scaled(38, 38)
+        pixmap = scaled_logo(38)
+        if pixmap is not None:
             logo_label.setPixmap(pixmap)
 
         title = QLabel(APP_NAME)
@@ -143,11 +143,12 @@ class Dashboard(QWidget):
 
     def _build_progress(self) -> QGroupBox:
         box = QGroupBox("Progress")
+        box.setUpdatesEnabled(False)
         layout = QGridLayout()
         # Filter STATUS_PHASES to only include relevant ones
-        relevant_phases = {k: v for k, v in STATUS_PHASES.items() if k != "excel"}
-        for i, phase in enumerate(relevant_phases):
-            label = QLabel(relevant_phases[phase])
+        relevant_phases = [(k, v) for k, v in STATUS_PHASES if k != "excel"]
+        for i, (phase, phase_label) in enumerate(relevant_phases):
+            label = QLabel(phase_label)
             bar = QProgressBar()
             bar.setRange(0, 100)
             bar.setValue(0)
@@ -168,6 +169,7 @@ class Dashboard(QWidget):
         self.status_label.setObjectName("status-label")
         layout.addWidget(self.status_label, len(self._progress_bars), 0, 1, 2)
         box.setLayout(layout)
+        box.setUpdatesEnabled(True)
         return box
 
     def _build_rate_limit(self) -> QGroupBox:
@@ -210,14 +212,21 @@ class Dashboard(QWidget):
         self.start_requested.emit(excel_path, sheet_url, interval_seconds)
 
     def update_progress(self, phase: str, percent: int, message: str) -> None:
-        if phase in self._progress_bars:
-            self._progress_bars[phase].setValue(max(0, min(100, percent)))
+        # One probe: status-only updates pass a phase with no bar
+        bar = self._progress_bars.get(phase)
+        if bar is not None:
+            bar.setValue(max(0, min(100, percent)))
         self.status_label.setText(message)
 
     def reset_progress(self) -> None:
-        for bar in self._progress_bars.values():
-            bar.setValue(0)
-        self.status_label.setText("Idle")
+        # Hold repaints so the bars and label redraw together once
+        self.setUpdatesEnabled(False)
+        try:
+            for bar in self._progress_bars.values():
+                bar.setValue(0)
+            self.status_label.setText("Idle")
+        finally:
+            self.setUpdatesEnabled(True)
 
     def set_countdown(self, seconds: int) -> None:
         if seconds <= 0:
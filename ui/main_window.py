@@ -1,40 +1,58 @@
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import QApplication, QMainWindow, QMessageBox
 
 import pandas as pd
 
 from pathlib import Path
 
-from core.github_analyzer import GitHubAnalyzer
+from core.github_analyzer import TEAM_CONCURRENCY, GitHubAnalyzer
 from core.github_analyzer import RepoSnapshot
 from core.scheduler import Scheduler
+from data import io_queue
 from data.excel_manager import is_valid_excel, read_excel
-from data.google_sheets_manager import append_commit_history_rows, get_existing_commit_shas, get_or_create_team_worksheet
+from data.google_sheets_manager import append_commit_history_batch, prepare_team_worksheets
 from ui.dashboard import Dashboard
 from ui.styles import DARK, LIGHT, apply_palette, stylesheet
 from utils.constants import APP_NAME
 from utils.state_store import load_state, save_state
 
 
-class AnalyzeWorker(QThread):
+# Minimum seconds between throttled progress updates from a cycle
+PROGRESS_INTERVAL = 0.05
+
+
+class WorkerSignals(QObject):
     progress = pyqtSignal(str, int, str)
     finished = pyqtSignal(str)
     failed = pyqtSignal(str)
     rate_limit = pyqtSignal(int, int)  # remaining, limit
 
-    def __init__(
-        self,
-        excel_path: str,
-        sheet_url: str,
-        parent: Optional[QMainWindow] = None,
-    ) -> None:
-        super().__init__(parent)
+
+class AnalyzeWorker(QRunnable):
+    """One monitoring cycle, run on the window's thread pool.
+
+    QRunnable cannot carry signals, so they live on a WorkerSignals object
+    the window creates and connects once and hands to every cycle.
+    """
+
+    def __init__(self, excel_path: str, sheet_url: str, signals: WorkerSignals) -> None:
+        super().__init__()
         self.excel_path = excel_path
         self.sheet_url = sheet_url
+        self.progress = signals.progress
+        self.finished = signals.finished
+        self.failed = signals.failed
+        self.rate_limit = signals.rate_limit
+        # Progress from the fetch threads is throttled; see _throttled_progress
+        self._progress_lock = threading.Lock()
+        self._last_progress = 0.0
 
     def run(self) -> None:
         try:
@@ -48,95 +66,135 @@ class AnalyzeWorker(QThread):
             raise ValueError("Excel input is required for team list.")
 
         analyzer = GitHubAnalyzer()
-        # Initial rate limit emit
-        rl_info = analyzer.get_rate_limit_info()
-        if rl_info["remaining"] is not None:
-            self.rate_limit.emit(rl_info["remaining"], rl_info["limit"])
-
-        self.progress.emit("process", 10, "Reading Excel submissions")
-        df = read_excel(self.excel_path)
-        df.drop_duplicates(subset=["Team Name", "GitHub Repo URL"], keep="last", inplace=True)
-        total = len(df)
-
-        if self.sheet_url:
-            self.progress.emit("sheets", 5, "Preparing Google Sheets output")
-
-        for idx, row in df.iterrows():
-            repo_url = str(row.get("GitHub Repo URL", "")).strip()
-            if not repo_url:
-                continue
-            team_name = str(row.get("Team Name", "")).strip()
-            pct = int(((idx + 1) / max(total, 1)) * 100)
-            self.progress.emit("fetch", min(95, pct), f"Fetching commits for {repo_url}")
-
-            known_shas: set[str] = set()
-            worksheet_title = team_name
-
-            if self.sheet_url:
-                ws = get_or_create_team_worksheet(self.sheet_url, team_title=worksheet_title)
-                known_shas = get_existing_commit_shas(ws)
-
-            snapshot = analyzer.analyze_commit_history(
-                team_key=worksheet_title,
-                repo_url=repo_url,
-                known_shas=known_shas,
-                progress_cb=self.progress.emit,
-            )
-
-            # Emit rate limit after fetch
+        try:
+            # Initial rate limit emit
             rl_info = analyzer.get_rate_limit_info()
             if rl_info["remaining"] is not None:
                 self.rate_limit.emit(rl_info["remaining"], rl_info["limit"])
 
-            rows = self._snapshot_to_rows(snapshot)
+            self.progress.emit("process", 10, "Reading Excel submissions")
+            df = read_excel(self.excel_path)
+            # Dedupe on one joined string key rather than a two-column row comparison
+            key = df["Team Name"] + "\x1f" + df["GitHub Repo URL"]
+            df = df[~key.duplicated(keep="last")]
 
-            # Google Sheets append
+            history: list[tuple] = []
             if self.sheet_url:
-                ws = get_or_create_team_worksheet(self.sheet_url, team_title=worksheet_title)
-                existing = get_existing_commit_shas(ws)
-                new_rows = [r for r in rows if r and r[0] and r[0] not in existing]
-                append_commit_history_rows(ws, new_rows)
-
-                # Emit rate limit after sheet write (though append doesn't use GitHub API, it's good practice)
-                rl_info = analyzer.get_rate_limit_info()
-                if rl_info["remaining"] is not None:
-                    self.rate_limit.emit(rl_info["remaining"], rl_info["limit"])
-
-        if self.sheet_url:
-            self.progress.emit("sheets", 100, "Google Sheets updated")
+                self.progress.emit("sheets", 5, "Preparing Google Sheets output")
+
+            # read_excel yields plain strings, so rows are read as tuples without boxing
+            teams = [
+                (str(team_name).strip(), str(repo_url).strip())
+                for team_name, repo_url in df[["Team Name", "GitHub Repo URL"]].itertuples(index=False, name=None)
+                if str(repo_url).strip()
+            ]
+
+            # Worksheets and their known Sno values for all teams, read up front in one batch
+            sheets = prepare_team_worksheets(self.sheet_url, [t for t, _ in teams]) if self.sheet_url else {}
+
+            # Repos are fetched concurrently; the analyzer paces its own requests
+            # against the rate limit, so only the fan-out is bounded here
+            completed = 0
+            pool = ThreadPoolExecutor(max_workers=max(1, min(TEAM_CONCURRENCY, len(teams))), thread_name_prefix="team")
+            try:
+                futures = [pool.submit(self._snapshot_team, analyzer, team_name, repo_url, sheets.get(team_name)) for team_name, repo_url in teams]
+                for future in as_completed(futures):
+                    ws, next_row, rows = future.result()
+                    completed += 1
+                    pct = int(completed / len(teams) * 100)
+                    self._throttled_progress(
+                        "fetch", min(95, pct), f"Fetched {completed}/{len(teams)} repositories", force=completed == len(teams)
+                    )
+
+                    # Emit rate limit after fetch
+                    rl_info = analyzer.get_rate_limit_info()
+                    if rl_info["remaining"] is not None:
+                        self.rate_limit.emit(rl_info["remaining"], rl_info["limit"])
+
+                    if ws is not None:
+                        history.append((ws, next_row, rows))
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
 
-        self.progress.emit("process", 100, "Done")
-        self.finished.emit("Monitoring snapshot complete")
+            if self.sheet_url:
+                # Every team's rows go out in one batched Sheets write
+                self.progress.emit("sheets", 50, "Writing commit history to Google Sheets")
+                append_commit_history_batch(self.sheet_url, history)
+                self.progress.emit("sheets", 100, "Google Sheets updated")
+
+            self.progress.emit("process", 100, "Done")
+            self.finished.emit("Monitoring snapshot complete")
+        finally:
+            analyzer.close()
+
+    def _snapshot_team(self, analyzer: GitHubAnalyzer, team_name: str, repo_url: str, sheet: Optional[tuple]) -> tuple:
+        """Fetch one team's new commits; returns (worksheet, first free row, rows to write).
+
+        sheet is the team's (worksheet, known Sno values, first free row) from
+        prepare_team_worksheets, or None when no Google Sheet is configured.
+        """
+        ws, known_shas, next_row = sheet or (None, set(), 1)
+        worksheet_title = team_name
+
+        snapshot = analyzer.analyze_commit_history(
+            team_key=worksheet_title,
+            repo_url=repo_url,
+            known_shas=known_shas,
+            progress_cb=self._repo_status,
+        )
+        # The sheet is only written at the end of the cycle, so the values read
+        # up front are current for this team; rows duplicated by another team
+        # on the same worksheet are dropped in append_commit_history_batch
+        rows = [r for r in self._snapshot_to_rows(snapshot) if r and r[0] and r[0] not in known_shas]
+        return ws, next_row, rows
+
+    def _repo_status(self, _phase: str, _percent: int, message: str) -> None:
+        # Per-repo percentages interleave across threads; keep the bar on the
+        # overall count and only forward the status text
+        self._throttled_progress("", 0, message)
+
+    def _throttled_progress(self, phase: str, percent: int, message: str, force: bool = False) -> None:
+        # Every emit is queued across threads and repaints the dashboard; at most
+        # one per PROGRESS_INTERVAL keeps the UI smooth on large runs
+        with self._progress_lock:
+            now = time.monotonic()
+            if not force and now - self._last_progress < PROGRESS_INTERVAL:
+                return
+            self._last_progress = now
+        self.progress.emit(phase, percent, message)
 
     @staticmethod
     def _snapshot_to_rows(snapshot: RepoSnapshot) -> list[list[str]]:
-        rows: list[list[str]] = []
-        for i, c in enumerate(snapshot.commits, start=1):
-            # Parse date and time from date_utc (format: 2024-02-25T12:34:56Z)
-            try:
-                dt = datetime.strptime(c.date_utc, "%Y-%m-%dT%H:%M:%SZ")
-                commit_date = dt.strftime("%Y-%m-%d")
-                commit_time = dt.strftime("%H:%M:%S")
-            except Exception:
-                commit_date = c.date_utc
-                commit_time = ""
-
-            rows.append(
-                [
-                    str(i),                    # Sno
-                    commit_date,               # Commit Date
-                    commit_time,               # Commit Time
-                    c.message,                 # Commit Message
-                    str(c.total_lines),        # Total Lines
-                    str(c.total_files),        # Total Files
-                    snapshot.languages,        # Languages
-                    snapshot.snapshot_timestamp_utc, # Snapshot Timestamp
-                ]
-            )
+        # Sized once up front; the per-snapshot columns are hoisted out of the loop
+        commits = snapshot.commits
+        languages = snapshot.languages
+        timestamp = snapshot.snapshot_timestamp_utc
+        rows: list[list[str]] = [None] * len(commits)  # type: ignore[list-item]
+        for i, c in enumerate(commits):
+            # Split date and time from date_utc (format: 2024-02-25T12:34:56Z);
+            # the shape is fixed, so slicing replaces a strptime round-trip
+            date_utc = c.date_utc
+            if len(date_utc) >= 19 and date_utc[10] == "T":
+                commit_date, commit_time = date_utc[:10], date_utc[11:19]
+            else:
+                commit_date, commit_time = date_utc, ""
+
+            rows[i] = [
+                str(i + 1),                # Sno
+                commit_date,               # Commit Date
+                commit_time,               # Commit Time
+                c.message,                 # Commit Message
+                str(c.total_lines),        # Total Lines
+                str(c.total_files),        # Total Files
+                languages,                 # Languages
+                timestamp,                 # Snapshot Timestamp
+            ]
         return rows
 
 
 class MainWindow(QMainWindow):
+    _state_loaded = pyqtSignal(object)
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle(APP_NAME)
@@ -153,13 +211,31 @@ class MainWindow(QMainWindow):
         self.dashboard.stop_requested.connect(self._handle_stop)
         self.dashboard.theme_toggled.connect(self._toggle_theme)
 
-        self._current_worker: Optional[AnalyzeWorker] = None
+        # Cycles run one at a time on a reused pool thread; the signals are
+        # connected once here instead of on every cycle
+        self._worker_pool = QThreadPool(self)
+        self._worker_pool.setMaxThreadCount(1)
+        # Idle threads expire after 30 s by default, far shorter than an interval
+        self._worker_pool.setExpiryTimeout(-1)
+        self._worker_signals = WorkerSignals(self)
+        self._worker_signals.progress.connect(self.dashboard.update_progress)
+        self._worker_signals.rate_limit.connect(self.dashboard.set_rate_limit)
+        self._worker_signals.finished.connect(self._on_finished)
+        self._worker_signals.failed.connect(self._on_failed)
+        self._worker_running = False
         self._monitoring = False
         self._dark = True
         self._apply_theme()
 
-        # restore last state if present
-        state = load_state()
+        # restore last state if present; the file is read on the io_queue
+        # thread and applied back on the UI thread through _state_loaded
+        self._state_loaded.connect(self._restore_state)
+        io_queue.submit(load_state).add_done_callback(lambda f: self._state_loaded.emit(f.result()))
+
+    def _restore_state(self, state: object) -> None:
+        if self._monitoring:
+            # The user started before the file was read; keep what they entered
+            return
         excel_path = state.get("excel_path", "") if isinstance(state, dict) else ""
         sheet_url = state.get("sheet_url", "") if isinstance(state, dict) else ""
         interval_seconds = state.get("interval_seconds", 0) if isinstance(state, dict) else 0
@@ -175,7 +251,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Invalid File", "Please choose a valid Excel (.xlsx or .xlsm) file.")
             return
 
-        save_state({"excel_path": excel_path, "sheet_url": sheet_url, "interval_seconds": interval_seconds})
+        # Queued behind any earlier state read or write; the UI never waits on disk
+        io_queue.submit(save_state, {"excel_path": excel_path, "sheet_url": sheet_url, "interval_seconds": interval_seconds})
         self.dashboard.reset_progress()
         self.dashboard.set_busy(True)
         self._monitoring = True
@@ -186,12 +263,12 @@ class MainWindow(QMainWindow):
         self.scheduler.stop()
         self._monitoring = False
         self.dashboard.set_monitoring(False)
-        if not (self._current_worker and self._current_worker.isRunning()):
+        if not self._worker_running:
             self.dashboard.set_busy(False)
             self.dashboard.set_countdown(0)
 
     def _run_cycle(self) -> None:
-        if self._current_worker and self._current_worker.isRunning():
+        if self._worker_running:
             return
 
         excel_path = self.dashboard.excel_edit.text().strip()
@@ -200,12 +277,8 @@ class MainWindow(QMainWindow):
 
         self.dashboard.reset_progress()
         self.dashboard.set_busy(True)
-        self._current_worker = AnalyzeWorker(excel_path, sheet_url, parent=self)
-        self._current_worker.progress.connect(self.dashboard.update_progress)
-        self._current_worker.rate_limit.connect(self.dashboard.set_rate_limit)
-        self._current_worker.finished.connect(self._on_finished)
-        self._current_worker.failed.connect(self._on_failed)
-        self._current_worker.start()
+        self._worker_running = True
+        self._worker_pool.start(AnalyzeWorker(excel_path, sheet_url, self._worker_signals))
 
     def _on_finished(self, message: str) -> None:
         self.dashboard.update_progress("fetch", 100, message)
@@ -213,7 +286,7 @@ class MainWindow(QMainWindow):
         self.dashboard.update_progress("process", 100, message)
         if self._monitoring:
             self.dashboard.set_monitoring(True)
-        self._current_worker = None
+        self._worker_running = False
 
     def _on_failed(self, error: str) -> None:
         self.dashboard.update_progress("fetch", 0, "")
@@ -223,7 +296,7 @@ class MainWindow(QMainWindow):
         QMessageBox.critical(self, "Run failed", message)
         if self._monitoring:
             self.dashboard.set_monitoring(True)
-        self._current_worker = None
+        self._worker_running = False
 
     def _toggle_theme(self) -> None:
         self._dark = not self._dark
@@ -31,7 +31,21 @@ LIGHT = {
 }
 
 
+# Themes are the fixed DARK/LIGHT dicts above, so built palettes and
+# stylesheets are cached by identity and reused on every toggle
+_palette_cache: dict[int, QPalette] = {}
+_stylesheet_cache: dict[int, str] = {}
+
+
 def apply_palette(app: QApplication, theme: dict) -> None:
+    palette = _palette_cache.get(id(theme))
+    if palette is None:
+        palette = _build_palette(theme)
+        _palette_cache[id(theme)] = palette
+    app.setPalette(palette)
+
+
+def _build_palette(theme: dict) -> QPalette:
     palette = QPalette()
     palette.setColor(QPalette.ColorRole.Window, QColor(theme["bg"]))
     palette.setColor(QPalette.ColorRole.Base, QColor(theme["panel"]))
@@ -44,10 +58,18 @@ def apply_palette(app: QApplication, theme: dict) -> None:
     palette.setColor(QPalette.ColorRole.Highlight, QColor(theme["accent"]))
     palette.setColor(QPalette.ColorRole.BrightText, QColor(theme["accent"]))
     palette.setColor(QPalette.ColorRole.PlaceholderText, QColor(theme["text_secondary"]).lighter())
-    app.setPalette(palette)
+    return palette
 
 
 def stylesheet(theme: dict) -> str:
+    sheet = _stylesheet_cache.get(id(theme))
+    if sheet is None:
+        sheet = _build_stylesheet(theme)
+        _stylesheet_cache[id(theme)] = sheet
+    return sheet
+
+
+def _build_stylesheet(theme: dict) -> str:
     accent = theme["accent"]
     accent_hover = theme["accent_hover"]
     accent_pressed = theme["accent_pressed"]
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+
+from utils.constants import LOGO_PATH
+
+
+# QPixmap needs a running QApplication, so the logo is loaded on first use
+# rather than at import; after that every caller shares one decoded copy
+@lru_cache(maxsize=1)
+def logo_pixmap() -> Optional[QPixmap]:
+    if not LOGO_PATH.exists():
+        return None
+    pixmap = QPixmap(str(LOGO_PATH))
+    return None if pixmap.isNull() else pixmap
+
+
+@lru_cache(maxsize=8)
+def scaled_logo(size: int) -> Optional[QPixmap]:
+    pixmap = logo_pixmap()
+    if pixmap is None:
+        return None
+    return pixmap.scaled(
+        size,
+        size,
+        Qt.AspectRatioMode.IgnoreAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
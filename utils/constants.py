@@ -3,6 +3,7 @@ from pathlib import Path
 APP_NAME = "HackTrack"
 DEFAULT_INTERVAL_HOURS = 1
 GITHUB_API_BASE = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_BASE}/graphql"
 GITHUB_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
 ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
@@ -33,8 +34,9 @@ COMMIT_HISTORY_HEADERS = [
     "Snapshot Timestamp",
 ]
 
-STATUS_PHASES = {
-    "fetch": "Fetching from GitHub",
-    "process": "Processing data",
-    "sheets": "Saving to Google Sheets",
-}
+# (phase key, label) in display order; a fixed tuple since it is only iterated
+STATUS_PHASES = (
+    ("fetch", "Fetching from GitHub"),
+    ("process", "Processing data"),
+    ("sheets", "Saving to Google Sheets"),
+)
@@ -1,17 +1,23 @@
 import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Callable, Optional, Tuple
 from urllib.parse import urlparse
 
 from .constants import GITHUB_DATE_FORMAT
 
+_GITHUB_PREFIXES = ("https://github.com/", "http://github.com/", "github.com/")
+_GITHUB_PATH_RE = re.compile(r"github\.com[/:]+([^/\s]+)/([^/\s]+)", re.IGNORECASE)
+
 
 def get_github_token() -> Optional[str]:
     token = os.getenv("GITHUB_TOKEN", "").strip()
     return token or None
 
 
+# Submission URLs repeat every monitoring cycle, so parses are memoized
+@lru_cache(maxsize=4096)
 def parse_repo_from_url(url: str) -> Optional[Tuple[str, str]]:
     raw = url.replace("\u00a0", " ").strip().strip("'\"").strip("<>[](){} ")
     if not raw:
@@ -22,8 +28,16 @@ def parse_repo_from_url(url: str) -> Optional[Tuple[str, str]]:
 
     owner = repo = None
 
+    # Fast path for the usual https://github.com/owner/repo[/...] form
+    if raw.startswith(_GITHUB_PREFIXES):
+        head, _, rest = raw.split("github.com/", 1)[1].partition("/")
+        name = rest.partition("/")[0]
+        if head and name:
+            owner, repo = head, name
+
+    found = bool(owner and repo)
     # SSH form: git@github.com:owner/repo.git
-    if raw.startswith("git@"):
+    if not found and raw.startswith("git@"):
         parts = raw.split(":", 1)
         if len(parts) == 2:
             path = parts[1]
@@ -31,8 +45,9 @@ def parse_repo_from_url(url: str) -> Optional[Tuple[str, str]]:
             if len(owner_repo) >= 2:
                 owner = owner_repo[0]
                 repo = owner_repo[1]
-    else:
-        parsed = urlparse(raw if re.match(r"^https?://", raw, flags=re.IGNORECASE) else f"https://{raw}")
+    elif not found:
+        has_scheme = raw[:8].lower().startswith(("http://", "https://"))
+        parsed = urlparse(raw if has_scheme else f"https://{raw}")
         host = parsed.netloc.lower()
         if "github.com" in host:
             segments = [s for s in parsed.path.lstrip("/").split("/") if s]
@@ -42,7 +57,7 @@ def parse_repo_from_url(url: str) -> Optional[Tuple[str, str]]:
     # Fallback regex search anywhere in the string
     if not (owner and repo):
         # tolerate missing second slash and embedded text
-        match = re.search(r"github\.com[/:]+([^/\s]+)/([^/\s]+)", raw, flags=re.IGNORECASE)
+        match = _GITHUB_PATH_RE.search(raw)
         if match:
             owner, repo = match.group(1), match.group(2)
 
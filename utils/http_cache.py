@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import orjson
+
+CACHE_FILE = Path(__file__).resolve().parent.parent / "http_cache.sqlite3"
+
+# SQLite caps bound parameters per statement
+_SQL_BATCH = 500
+
+_lock = threading.Lock()
+_conn: Optional[sqlite3.Connection] = None
+
+
+def _connection() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(CACHE_FILE, check_same_thread=False)
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, etag TEXT, link TEXT, body TEXT);
+            CREATE TABLE IF NOT EXISTS blob_lines (sha TEXT PRIMARY KEY, lines INTEGER);
+            CREATE TABLE IF NOT EXISTS tree_totals (sha TEXT PRIMARY KEY, files INTEGER, lines INTEGER);
+            CREATE TABLE IF NOT EXISTS page_heads (url TEXT PRIMARY KEY, head TEXT);
+            """
+        )
+        _conn = conn
+    return _conn
+
+
+def get_response(url: str) -> Optional[Tuple[str, Any, str]]:
+    """Return (etag, payload, link header) stored for url, if any."""
+    try:
+        with _lock:
+            row = _connection().execute("SELECT etag, body, link FROM responses WHERE url = ?", (url,)).fetchone()
+        if not row:
+            return None
+        return row[0], orjson.loads(row[1]), row[2] or ""
+    except Exception:
+        return None
+
+
+def put_response(url: str, etag: str, payload: Any, link: str = "") -> None:
+    try:
+        body = orjson.dumps(payload)
+        with _lock:
+            conn = _connection()
+            conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)", (url, etag, link, body))
+            conn.commit()
+    except Exception:
+        # Cache misses are harmless; never break a fetch over them
+        pass
+
+
+def get_blob_lines(shas: Iterable[str]) -> Dict[str, int]:
+    keys = list(shas)
+    found: Dict[str, int] = {}
+    try:
+        with _lock:
+            conn = _connection()
+            for start in range(0, len(keys), _SQL_BATCH):
+                batch = keys[start:start + _SQL_BATCH]
+                marks = ",".join("?" * len(batch))
+                found.update(conn.execute(f"SELECT sha, lines FROM blob_lines WHERE sha IN ({marks})", batch).fetchall())
+    except Exception:
+        pass
+    return found
+
+
+def put_blob_lines(counts: Dict[str, int]) -> None:
+    if not counts:
+        return
+    try:
+        with _lock:
+            conn = _connection()
+            conn.executemany("INSERT OR REPLACE INTO blob_lines VALUES (?, ?)", counts.items())
+            conn.commit()
+    except Exception:
+        pass
+
+
+def get_tree_totals(sha: str) -> Optional[Tuple[int, int]]:
+    try:
+        with _lock:
+            row = _connection().execute("SELECT files, lines FROM tree_totals WHERE sha = ?", (sha,)).fetchone()
+        return (row[0], row[1]) if row else None
+    except Exception:
+        return None
+
+
+def put_tree_totals(sha: str, totals: Tuple[int, int]) -> None:
+    try:
+        with _lock:
+            conn = _connection()
+            conn.execute("INSERT OR REPLACE INTO tree_totals VALUES (?, ?, ?)", (sha, totals[0], totals[1]))
+            conn.commit()
+    except Exception:
+        pass
+
+
+def get_page_head(url: str) -> Optional[str]:
+    """Return the page-1 ETag that was current when url's cached copy was fetched."""
+    try:
+        with _lock:
+            row = _connection().execute("SELECT head FROM page_heads WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else None
+    except Exception:
+        return None
+
+
+def put_page_head(url: str, head: str) -> None:
+    try:
+        with _lock:
+            conn = _connection()
+            conn.execute("INSERT OR REPLACE INTO page_heads VALUES (?, ?)", (url, head))
+            conn.commit()
+    except Exception:
+        pass
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict
 
@@ -18,10 +19,16 @@ def load_state() -> Dict[str, Any]:
 
 
 def save_state(data: Dict[str, Any]) -> None:
+    # Starting monitoring with unchanged inputs is the common case; skip the rewrite
+    if load_state() == data:
+        return
     try:
         STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with STATE_FILE.open("w", encoding="utf-8") as f:
+        # Write a sibling file and swap it in, so a crash never leaves a torn state file
+        tmp_file = STATE_FILE.with_suffix(".json.tmp")
+        with tmp_file.open("w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, STATE_FILE)
     except Exception:
         # Silently ignore persistence errors to avoid breaking UI
         pass